@@ -1,42 +1,18 @@
 # -*- coding: utf-8 -*-
-from gmpy2 import fac
+from gmpy2 import fac, mpq
 import numpy as np
-from numbers import Rational, Real
-from sympy import symbols
+from numbers import Rational, Real, Number, Integral
+from sympy import symbols, Symbol, cancel
 from sympy.utilities.iterables import multiset_permutations
-from sympy.combinatorics.partitions import IntegerPartition
+from .partitions import Partition
 
 def __msp_symbol__(t):
      string = "M[" + ";".join([str(i) for i in t]) + "]"
      return symbols(string, commutative=False)
 
 
-def __is_decreasing__(x):
-    l = len(x)
-    i = 0
-    out = True
-    while i < l-1 and out:
-        out = x[i] >= x[i+1]
-        i = i + 1
-    return out
-
-
-def __drop_trailing_zeros__(x):
-    n = len(x) - 1
-    while n >= 0 and x[n] == 0:
-        x.pop()
-        n = n - 1
-    return x
-
-
 def __make_partition__(x):
-    mu = __drop_trailing_zeros__(x)
-    integers = map(lambda i: isinstance(i, int), mu)
-    if not all(integers):
-        raise ValueError("invalid integer partition.")
-    if not __is_decreasing__(list(mu) + [0]):
-        raise ValueError("invalid integer partition.")
-    return np.asarray(mu, dtype=int)
+    return np.asarray(Partition(x), dtype=int)
     
 
 def __permutations__(mu):
@@ -52,6 +28,49 @@ def __get_domain__(x):
         return None    
 
 
+def __check_alpha__(alpha):
+    if isinstance(alpha, Number):
+        if not isinstance(alpha, Real):
+            raise ValueError("`alpha` must be a real number.")
+        if alpha <= 0:
+            raise ValueError("`alpha` must be positive.")
+        if isinstance(alpha, Integral):
+            alpha = mpq(alpha)
+        domain = __get_domain__(alpha)
+    elif isinstance(alpha, Symbol):
+        domain = 'QQ(alpha)'
+    else:
+        raise ValueError("`alpha` must be a number.")
+    return (alpha, domain)
+
+
+def __check_n__(n):
+    if n is None:
+        return None
+    if not (isinstance(n, int) and n >= 1):
+        raise ValueError("`n` must be `None` or a strictly positive integer.")
+    return n
+
+
+def __simplify__(x, alpha):
+    if isinstance(alpha, Symbol):
+        return cancel(x)
+    return x
+
+
+def __chop__(coefficients, scales, alpha):
+    # drop the zero coefficients, and, in inexact arithmetic, the round-off
+    # residues of the cancellations; `scales` gives for each key the sum of
+    # the absolute values of the terms that were added up
+    if __get_domain__(alpha) != 'RR':
+        return {k: c for k, c in coefficients.items() if c != 0}
+    return {
+        k: c for k, c in coefficients.items() if c != 0 and not (
+            isinstance(c, Real) and abs(c) <= 1e-12 * scales.get(k, 0)
+        )
+    }
+
+
 # def __partition_to_array__(mu):
 #     d = mu.as_dict()
 #     if len(d) == 0:
@@ -60,30 +79,26 @@ def __get_domain__(x):
 
 
 def __hook_lengths_lower__(mu, alpha):
-    mu_prime = np.array(IntegerPartition(mu).conjugate)
-    i = np.repeat(np.arange(len(mu)), mu)
-    j = np.concatenate([np.arange(n) for n in mu])
-    x = mu_prime[j] - i + alpha*(mu[i] - j) 
+    mu = Partition(mu)
+    x = mu.leg_lengths + 1 + alpha*(mu.arm_lengths + 1)
     return x - alpha
 
 def __hook_lengths_upper__(mu, alpha):
-    mu_prime = np.array(IntegerPartition(mu).conjugate)
-    i = np.repeat(np.arange(len(mu)), mu)
-    j = np.concatenate([np.arange(n) for n in mu])
-    x = mu_prime[j] - i + alpha*(mu[i] - j) 
+    mu = Partition(mu)
+    x = mu.leg_lengths + 1 + alpha*(mu.arm_lengths + 1)
     return x - 1
 
 def __hook_lengths__(mu, alpha):
-    mu_prime = np.array(IntegerPartition(mu).conjugate)
-    i = np.repeat(np.arange(len(mu)), mu)
-    j = np.concatenate([np.arange(n) for n in mu])
-    x = mu_prime[j] - i + alpha*(mu[i] - j) 
+    mu = Partition(mu)
+    x = mu.leg_lengths + 1 + alpha*(mu.arm_lengths + 1)
     return (x - alpha, x - 1)
 
 def __Jack_C_coefficient__(kappa, alpha):
+    if len(kappa) == 0:
+        return 1
     (hookl, hooku) = __hook_lengths__(kappa, alpha)
     jlambda = np.prod(hooku) * np.prod(hookl)
-    k = int(np.sum(kappa))
+    k = Partition(kappa).weight
     return alpha**k * fac(k) / jlambda
 
 def __Jack_P_coefficient__(kappa, alpha):
@@ -99,6 +114,38 @@ def __Jack_Q_coefficient__(kappa, alpha):
     return 1 / np.prod(hooku)
 
 
+def __Jack_coefficient__(kappa, alpha, which):
+    if which == 'J':
+        return 1
+    if which == 'C':
+        return __Jack_C_coefficient__(kappa, alpha)
+    if which == 'P':
+        return __Jack_P_coefficient__(kappa, alpha)
+    return __Jack_Q_coefficient__(kappa, alpha)
+
+
+def __Jack_ratio__(kappa, alpha, which1, which2):
+    # the Jack polynomial of kind `which1` is this ratio times the one of
+    # kind `which2`
+    if len(kappa) == 0 or which1 == which2:
+        return 1
+    if which2 == 'J':
+        return __Jack_coefficient__(kappa, alpha, which1)
+    return (
+        __Jack_coefficient__(kappa, alpha, which1)
+        / __Jack_coefficient__(kappa, alpha, which2)
+    )
+
+
+def __Jack_b__(kappa, i, j, alpha):
+    # Jack limit of Macdonald's b_kappa(s) for the box s = (i, j)
+    if i >= len(kappa) or j >= kappa[i]:
+        return 1
+    a = kappa[i] - j - 1
+    l = kappa.conjugate[j] - i - 1
+    return (alpha*a + l + 1) / (alpha*a + l + alpha)
+
+
 def __betaratio__(kappa, mu, k, alpha):
     k += 1
     t = k - alpha*mu[k-1] 
@@ -114,12 +161,3 @@ def __betaratio__(kappa, mu, k, alpha):
         * np.prod((v + alpha) / v)
         * np.prod((w + alpha) / w)
     )
-
-
-def __N__(kappa, mu):
-    n = len(kappa)
-    if n == 0:
-        return 0
-    nu = kappa + 1
-    M = np.array([np.prod(nu[(i+1):]) for i in range(n)])
-    return np.sum(mu * M)
@@ -1,17 +1,14 @@
 # -*- coding: utf-8 -*-
 from gmpy2 import mpq
 import numpy as np
-from sympy import symbols, Poly, Symbol
+from sympy import symbols, Poly
 from .internal import (
-    __get_domain__,
+    __check_alpha__,
     __make_partition__,
-    __N__,
     __betaratio__,
-    __Jack_C_coefficient__,
-    __Jack_P_coefficient__,
-    __Jack_Q_coefficient__
+    __Jack_coefficient__
 )
-from numbers import Real, Number, Integral 
+from .partitions import Partition
 
 def SchurPol(n, kappa):
     """
@@ -54,26 +51,26 @@ def SchurPol(n, kappa):
             return Poly(0, *variables, domain='ZZ')
         if m == 1:
             return x[0]**nu[0]
-        N = __N__(kappa_, nu)
-        s = S[N-1, m-1]
-        if s is not None:
-            return s
-        s = sch(S.copy(), m-1, 1, nu)
+        if k == 1:
+            key = (Partition(nu), m)
+            s = S.get(key)
+            if s is not None:
+                return s
+        s = sch(S, m-1, 1, nu)
         i = k
         while len(nu) >= i and nu[i-1] > 0:
             if len(nu) == i or nu[i-1] > nu[i]:
                 _nu = nu.copy()
                 _nu[i-1] = nu[i-1]-1
                 if nu[i-1] > 1:
-                    s = s + x[m-1] * sch(S.copy(), m, i, _nu)
+                    s = s + x[m-1] * sch(S, m, i, _nu)
                 else:
-                    s = s + x[m-1] * sch(S.copy(), m-1, 1, _nu)
+                    s = s + x[m-1] * sch(S, m-1, 1, _nu)
             i = i + 1
         if k == 1:
-            S[__N__(kappa_, nu)-1, m-1] = s
+            S[key] = s
         return s
-    S = np.full((__N__(kappa_,kappa_), n), None)
-    return sch(S.copy(), n, 1, kappa_)
+    return sch({}, n, 1, kappa_)
 
 
 def JackPol(n, kappa, alpha, which = 'J'):
@@ -113,18 +110,7 @@ def JackPol(n, kappa, alpha, which = 'J'):
     if not (isinstance(n, int) and n >= 1):
         raise ValueError("`n` must be a strictly positive integer.")
     kappa_ = __make_partition__(kappa)
-    if isinstance(alpha, Number):
-        if not isinstance(alpha, Real):
-            raise ValueError("`alpha` must be a real number.")
-        if alpha <= 0:
-            raise ValueError("`alpha` must be positive.")
-        if isinstance(alpha, Integral):
-            alpha = mpq(alpha)
-        domain = __get_domain__(alpha)
-    elif isinstance(alpha, Symbol):
-        domain = 'QQ(alpha)'
-    else:
-        raise ValueError("`alpha` must be a number.")
+    (alpha, domain) = __check_alpha__(alpha)
     if not which in ['J', 'C', 'P', 'Q']:
         raise ValueError("`which` must be either 'J', 'C', 'P' or 'Q'.")
     variables = [symbols(f'x_{i}') for i in range(1, n+1)]
@@ -137,14 +123,16 @@ def JackPol(n, kappa, alpha, which = 'J'):
         if m == 1:
             coef = np.prod(alpha * np.arange(1, nu[0]) + 1)
             return coef * x[0]**nu[0]
-        s = S[__N__(kappa_,nu)-1, m-1]
-        if k == 0 and s is not None:
-            return s
+        if k == 0:
+            key = (Partition(nu), m)
+            s = S.get(key)
+            if s is not None:
+                return s
         i = max(1, k)
         s = (
-            jac(S.copy(), m-1, 0, nu, nu, 1)
+            jac(S, m-1, 0, nu, nu, 1)
             * beta
-            * x[m-1]**(np.sum(mu) - np.sum(nu))
+            * x[m-1]**(Partition(mu).weight - Partition(nu).weight)
         )
         while len(nu) >= i and nu[i-1] > 0:
             if len(nu) == i or nu[i-1] > nu[i]:
@@ -152,25 +140,21 @@ def JackPol(n, kappa, alpha, which = 'J'):
                 _nu[i-1] = nu[i-1]-1
                 gamma = beta * __betaratio__(mu, nu, i-1, alpha)
                 if nu[i-1] > 1:
-                    s = s + jac(S.copy(), m, i, mu, _nu, gamma)
+                    s = s + jac(S, m, i, mu, _nu, gamma)
                 else:
                     s = (
-                        s + jac(S.copy(), m-1, 0, _nu, _nu, 1) * gamma
-                        * x[m-1]**(np.sum(mu) - np.sum(_nu))
+                        s + jac(S, m-1, 0, _nu, _nu, 1) * gamma
+                        * x[m-1]**(
+                            Partition(mu).weight - Partition(_nu).weight
+                        )
                     )
             i += 1
         if k == 0:
-            S[__N__(kappa_, nu)-1, m-1] = s
+            S[key] = s
         return s
-    S = np.full((__N__(kappa_,kappa_), n), None)
-    jp = jac(S.copy(), n, 0, kappa_, kappa_, 1)
+    jp = jac({}, n, 0, kappa_, kappa_, 1)
     if which != 'J':
-        if which == 'C':
-            jp = __Jack_C_coefficient__(kappa_, alpha) * jp
-        elif which == 'P':
-            jp = __Jack_P_coefficient__(kappa_, alpha) * jp
-        else:
-            jp = __Jack_Q_coefficient__(kappa_, alpha) * jp
+        jp = __Jack_coefficient__(kappa_, alpha, which) * jp
     return jp
 
 
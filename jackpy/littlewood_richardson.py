@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+from functools import lru_cache
+from .internal import (
+    __check_alpha__,
+    __check_n__,
+    __chop__,
+    __simplify__,
+    __Jack_b__,
+    __Jack_ratio__
+)
+from .partitions import Partition
+
+
+# maximal number of entries kept by each of the caches of this module
+__CACHE_SIZE__ = 4096
+
+
+def __horizontal_strips__(lam, r, n):
+    # partitions mu containing lam such that mu/lam is a horizontal r-strip
+    l = len(lam) + 1 if n is None else min(len(lam) + 1, n)
+    mu = list(lam) + [0]
+    def rec(i, m):
+        if m == 0:
+            yield Partition._make([p for p in mu if p > 0])
+            return
+        if i == l:
+            return
+        top = m if i == 0 else min(m, lam[i-1] - mu[i])
+        for d in range(top, -1, -1):
+            mu[i] += d
+            yield from rec(i+1, m-d)
+            mu[i] -= d
+    yield from rec(0, r)
+
+
+def __vertical_strips__(lam, r, n):
+    # partitions mu containing lam such that mu/lam is a vertical r-strip
+    l = len(lam) + r if n is None else min(len(lam) + r, n)
+    mu = list(lam) + [0] * r
+    def rec(i, m):
+        if m == 0:
+            yield Partition._make([p for p in mu if p > 0])
+            return
+        if l - i < m:
+            return
+        if i == 0 or mu[i-1] > mu[i]:
+            mu[i] += 1
+            yield from rec(i+1, m-1)
+            mu[i] -= 1
+        yield from rec(i+1, m)
+    yield from rec(0, r)
+
+
+def __strip_columns__(lam, mu):
+    return {j for i in range(len(mu)) for j in range(
+        lam[i] if i < len(lam) else 0, mu[i]
+    )}
+
+
+@lru_cache(maxsize=__CACHE_SIZE__)
+def __lr_expansion__(lam, mu, n, bound=None):
+    # LR tableaux of content mu: the letters 1, 2, ... are added as
+    # horizontal strips and the reading word must be a lattice word, that is
+    # the number of letters k+1 in the rows 1..i cannot exceed the number of
+    # letters k in the rows 1..i-1; if `bound` is given, the shapes are kept
+    # inside this partition
+    out = {}
+    def add_letter(k, shape, previous):
+        if k == len(mu):
+            nu = Partition._make(shape)
+            out[nu] = out.get(nu, 0) + 1
+            return
+        l = len(shape) + 1 if n is None else min(len(shape) + 1, n)
+        if bound is not None:
+            l = min(l, len(bound))
+        new_shape = shape + [0]
+        counts = [0] * l
+        def rec(i, m, placed, allowed):
+            if m == 0:
+                add_letter(
+                    k+1, [p for p in new_shape if p > 0], counts.copy()
+                )
+                return
+            if i == l:
+                return
+            top = m if i == 0 else min(m, shape[i-1] - new_shape[i])
+            if previous is not None:
+                top = min(top, allowed - placed)
+            if bound is not None:
+                top = min(top, bound[i] - new_shape[i])
+            for d in range(top, -1, -1):
+                new_shape[i] += d
+                counts[i] = d
+                rec(
+                    i+1, m-d, placed+d,
+                    allowed + (previous[i] if previous is not None and
+                               i < len(previous) else 0)
+                )
+                new_shape[i] -= d
+            counts[i] = 0
+        rec(0, mu[k], 0, 0)
+    add_letter(0, list(lam), None)
+    return out
+
+
+def schur_pieri(lam, r, n=None, vertical=False):
+    """
+    Pieri rule for Schur polynomials.
+
+    Parameters
+    ----------
+    lam : list of integers
+        An integer partition given as a list of decreasing integers. Trailing
+        zeros are dropped.
+    r : int
+        Nonnegative integer.
+    n : int
+        If not `None`, the number of variables: the partitions with more than
+        `n` parts are dropped, since their Schur polynomial in `n` variables
+        is zero.
+    vertical : bool
+        Whether to multiply by the elementary symmetric polynomial `e_r`
+        instead of the complete homogeneous symmetric polynomial `h_r`.
+
+    Returns
+    -------
+    dict
+        A dictionary representing the product of the Schur polynomial of
+        `lam` with `h_r` (or `e_r`) as a linear combination of Schur
+        polynomials. The keys are the integer partitions, as `Partition`
+        objects, and the values are the coefficients, all equal to one.
+
+    Examples
+    --------
+    >>> from jackpy.littlewood_richardson import schur_pieri
+    >>> print(schur_pieri([2, 1], 1))
+    {(3, 1): 1, (2, 2): 1, (2, 1, 1): 1}
+
+    """
+    lam = Partition(lam)
+    n = __check_n__(n)
+    if not (isinstance(r, int) and r >= 0):
+        raise ValueError("`r` must be a nonnegative integer.")
+    if n is not None and len(lam) > n:
+        return {}
+    if vertical:
+        strips = __vertical_strips__(lam, r, n)
+    else:
+        strips = __horizontal_strips__(lam, r, n)
+    return {nu: 1 for nu in strips}
+
+
+def lr_coefficient(lam, mu, nu):
+    """
+    Littlewood-Richardson coefficient.
+
+    Parameters
+    ----------
+    lam, mu, nu : lists of integers
+        Integer partitions given as lists of decreasing integers. Trailing
+        zeros are dropped.
+
+    Returns
+    -------
+    int
+        The coefficient of the Schur polynomial of `nu` in the product of the
+        Schur polynomials of `lam` and `mu`.
+
+    Examples
+    --------
+    >>> from jackpy.littlewood_richardson import lr_coefficient
+    >>> lr_coefficient([2, 1], [2, 1], [3, 2, 1])
+    2
+
+    """
+    lam = Partition(lam)
+    mu = Partition(mu)
+    nu = Partition(nu)
+    if lam.weight + mu.weight != nu.weight:
+        return 0
+    if not (nu.contains(lam) and nu.contains(mu)):
+        return 0
+    if (mu.weight, len(mu)) > (lam.weight, len(lam)):
+        (lam, mu) = (mu, lam)
+    return __lr_expansion__(lam, mu, None, nu).get(nu, 0)
+
+
+def schur_product(lam, mu, n=None):
+    """
+    Product of two Schur polynomials in the Schur basis.
+
+    Parameters
+    ----------
+    lam, mu : lists of integers
+        Integer partitions given as lists of decreasing integers. Trailing
+        zeros are dropped.
+    n : int
+        If not `None`, the number of variables: the partitions with more than
+        `n` parts are dropped, since their Schur polynomial in `n` variables
+        is zero.
+
+    Returns
+    -------
+    dict
+        A dictionary representing the product of the Schur polynomials of
+        `lam` and `mu` as a linear combination of Schur polynomials. The keys
+        are the integer partitions, as `Partition` objects, and the values are
+        the Littlewood-Richardson coefficients. The polynomials are never
+        expanded, and the results are memoized (see `clear_caches`).
+
+    Examples
+    --------
+    >>> from jackpy.littlewood_richardson import schur_product
+    >>> print(schur_product([1], [1]))
+    {(2,): 1, (1, 1): 1}
+
+    """
+    lam = Partition(lam)
+    mu = Partition(mu)
+    n = __check_n__(n)
+    if n is not None and (len(lam) > n or len(mu) > n):
+        return {}
+    if (mu.weight, len(mu)) > (lam.weight, len(lam)):
+        (lam, mu) = (mu, lam)
+    if len(mu) <= 1:
+        return schur_pieri(lam, mu.weight, n)
+    if mu[0] == 1:
+        return schur_pieri(lam, mu.weight, n, vertical=True)
+    return dict(__lr_expansion__(lam, mu, n))
+
+
+def schur_combination_product(f, g, n=None):
+    """
+    Product of two linear combinations of Schur polynomials.
+
+    Parameters
+    ----------
+    f, g : dict
+        Dictionaries representing linear combinations of Schur polynomials,
+        such as the ones returned by `schur_product`: the keys are integer
+        partitions and the values are the coefficients.
+    n : int
+        If not `None`, the number of variables: the partitions with more than
+        `n` parts are dropped.
+
+    Returns
+    -------
+    dict
+        A dictionary representing the product of `f` and `g` as a linear
+        combination of Schur polynomials. The keys are `Partition` objects.
+
+    """
+    out = {}
+    for lam, a in f.items():
+        for mu, b in g.items():
+            for nu, c in schur_product(lam, mu, n).items():
+                out[nu] = out.get(nu, 0) + a * b * c
+    return {nu: c for nu, c in out.items() if c != 0}
+
+
+@lru_cache(maxsize=__CACHE_SIZE__)
+def __jack_pieri_P__(lam, r, alpha, n, vertical):
+    # coefficients of P_lam * e_r (vertical) or P_lam * g_r (horizontal)
+    # in the P-basis, Macdonald VI (6.24)
+    out = {}
+    if vertical:
+        strips = __vertical_strips__(lam, r, n)
+    else:
+        strips = __horizontal_strips__(lam, r, n)
+    for nu in strips:
+        columns = __strip_columns__(lam, nu)
+        rows = {i for i in range(len(nu)) if i >= len(lam) or nu[i] > lam[i]}
+        coef = 1
+        for j in columns:
+            for i in range(nu.conjugate[j]):
+                if vertical and i in rows:
+                    continue
+                coef = coef * __Jack_b__(nu, i, j, alpha) \
+                    / __Jack_b__(lam, i, j, alpha)
+        out[nu] = __simplify__(coef, alpha)
+    return out
+
+
+def __jack_pieri_combination_P__(f, r, alpha, n):
+    # f * e_r in the P-basis, f being a combination in the P-basis
+    out = {}
+    for lam, a in f.items():
+        for nu, c in __jack_pieri_P__(lam, r, alpha, n, True).items():
+            out[nu] = out.get(nu, 0) + a * c
+    return out
+
+
+@lru_cache(maxsize=__CACHE_SIZE__)
+def __e_expansion_P__(mu, alpha, n):
+    # e_{mu'} = e_{mu'_1} e_{mu'_2} ... in the P-basis; the transition matrix
+    # is unitriangular with respect to the dominance order
+    out = {Partition._make([]): 1}
+    for r in mu.conjugate:
+        out = __jack_pieri_combination_P__(out, r, alpha, n)
+    return out
+
+
+@lru_cache(maxsize=__CACHE_SIZE__)
+def __jack_product_P__(lam, mu, alpha, n):
+    # P_lam * P_mu = P_lam * e_{mu'} - sum_{nu < mu} a_{mu,nu} P_lam * P_nu
+    # where e_{mu'} = P_mu + sum_{nu < mu} a_{mu,nu} P_nu
+    out = {lam: 1}
+    for r in mu.conjugate:
+        out = __jack_pieri_combination_P__(out, r, alpha, n)
+    scales = {kappa: abs(c) for kappa, c in out.items()}
+    for nu, a in __e_expansion_P__(mu, alpha, n).items():
+        if nu != mu:
+            for kappa, c in __jack_product_P__(lam, nu, alpha, n).items():
+                out[kappa] = out.get(kappa, 0) - a * c
+                scales[kappa] = scales.get(kappa, 0) + abs(a * c)
+    # the coefficient of P_kappa can be nonzero only if kappa contains lam
+    # and mu, has at most len(lam) + len(mu) parts, and has a largest part
+    # kappa[0] = len(kappa') at most lam[0] + mu[0] = len(lam') + len(mu');
+    # with a float alpha the cancellations can leave round-off residues out
+    # of this support
+    out = {
+        kappa: __simplify__(c, alpha) for kappa, c in out.items()
+        if kappa.contains(lam) and kappa.contains(mu)
+        and len(kappa) <= len(lam) + len(mu)
+        and len(kappa.conjugate) <= len(lam.conjugate) + len(mu.conjugate)
+    }
+    return __chop__(out, scales, alpha)
+
+
+def clear_caches():
+    """
+    Clear the caches of this module.
+
+    The Littlewood-Richardson expansions and the Jack Pieri and product
+    coefficients are memoized, the latter ones for each value of the Jack
+    parameter. Each
+    cache is bounded, keeping the most recently used entries, but it can be
+    useful to empty them, e.g. after a sweep over many values of `alpha`.
+
+    Returns
+    -------
+    None
+
+    """
+    __lr_expansion__.cache_clear()
+    __jack_pieri_P__.cache_clear()
+    __e_expansion_P__.cache_clear()
+    __jack_product_P__.cache_clear()
+
+
+def jack_pieri(lam, r, alpha, which = 'J', n=None, vertical=False):
+    """
+    Pieri rule for Jack polynomials.
+
+    Parameters
+    ----------
+    lam : list of integers
+        An integer partition given as a list of decreasing integers. Trailing
+        zeros are dropped.
+    r : int
+        Nonnegative integer.
+    alpha : number
+        A positive number or a symbol, the parameter of the Jack polynomials.
+    which: character
+        Which Jack polynomials, either `'J'`, `'C'`, `'P'` or `'Q'`.
+    n : int
+        If not `None`, the number of variables: the partitions with more than
+        `n` parts are dropped, since their Jack polynomial in `n` variables
+        is zero.
+    vertical : bool
+        Whether to multiply by the Jack polynomial of the partition
+        `(1, ..., 1)` of `r` instead of the one of the partition `(r)`.
+
+    Returns
+    -------
+    dict
+        A dictionary representing the product of the Jack polynomial of `lam`
+        with the Jack polynomial of `(r)` (or of `(1, ..., 1)`) as a linear
+        combination of Jack polynomials, all of the same kind `which`. The
+        keys are the integer partitions, as `Partition` objects, and the
+        values are the coefficients.
+
+    Examples
+    --------
+    >>> from gmpy2 import mpq
+    >>> from jackpy.littlewood_richardson import jack_pieri
+    >>> combo = jack_pieri([1], 1, mpq(2), which = 'C')
+    >>> print(combo)
+    {(2,): mpq(1,1), (1, 1): mpq(1,1)}
+
+    """
+    lam = Partition(lam)
+    n = __check_n__(n)
+    if not (isinstance(r, int) and r >= 0):
+        raise ValueError("`r` must be a nonnegative integer.")
+    (alpha, _) = __check_alpha__(alpha)
+    if not which in ['J', 'C', 'P', 'Q']:
+        raise ValueError("`which` must be either 'J', 'C', 'P' or 'Q'.")
+    if n is not None and len(lam) > n:
+        return {}
+    rho = Partition._make([1] * r if vertical else [r] if r > 0 else [])
+    # the Jack polynomial of rho is a multiple of e_r = P_(1^r) or of
+    # g_r = Q_(r)
+    factor = (
+        __Jack_ratio__(rho, alpha, which, 'P' if vertical else 'Q')
+        * __Jack_ratio__(lam, alpha, which, 'P')
+    )
+    out = {}
+    for nu, c in __jack_pieri_P__(lam, r, alpha, n, vertical).items():
+        out[nu] = __simplify__(
+            factor * c * __Jack_ratio__(nu, alpha, 'P', which), alpha
+        )
+    return out
+
+
+def jack_product(lam, mu, alpha, which = 'J', n=None):
+    """
+    Product of two Jack polynomials in the Jack basis.
+
+    Parameters
+    ----------
+    lam, mu : lists of integers
+        Integer partitions given as lists of decreasing integers. Trailing
+        zeros are dropped.
+    alpha : number
+        A positive number or a symbol, the parameter of the Jack polynomials.
+    which: character
+        Which Jack polynomials, either `'J'`, `'C'`, `'P'` or `'Q'`.
+    n : int
+        If not `None`, the number of variables: the partitions with more than
+        `n` parts are dropped, since their Jack polynomial in `n` variables
+        is zero.
+
+    Returns
+    -------
+    dict
+        A dictionary representing the product of the Jack polynomials of
+        `lam` and `mu` as a linear combination of Jack polynomials, all of the
+        same kind `which`. The keys are the integer partitions, as `Partition`
+        objects, and the values are the coefficients. They are obtained from
+        the Pieri rule, without expanding the polynomials, and the results
+        are memoized (see `clear_caches`).
+
+    Examples
+    --------
+    >>> from gmpy2 import mpq
+    >>> from jackpy.littlewood_richardson import jack_product
+    >>> combo = jack_product([1], [1], mpq(2))
+    >>> print(combo)
+    {(2,): mpq(1,3), (1, 1): mpq(2,3)}
+
+    """
+    lam = Partition(lam)
+    mu = Partition(mu)
+    n = __check_n__(n)
+    (alpha, _) = __check_alpha__(alpha)
+    if not which in ['J', 'C', 'P', 'Q']:
+        raise ValueError("`which` must be either 'J', 'C', 'P' or 'Q'.")
+    if n is not None and (len(lam) > n or len(mu) > n):
+        return {}
+    if (mu.weight, len(mu)) > (lam.weight, len(lam)):
+        (lam, mu) = (mu, lam)
+    factor = (
+        __Jack_ratio__(lam, alpha, which, 'P')
+        * __Jack_ratio__(mu, alpha, which, 'P')
+    )
+    out = {}
+    for nu, c in __jack_product_P__(lam, mu, alpha, n).items():
+        out[nu] = __simplify__(
+            factor * c * __Jack_ratio__(nu, alpha, 'P', which), alpha
+        )
+    return out
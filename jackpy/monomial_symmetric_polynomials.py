@@ -1,13 +1,10 @@
 # -*- coding: utf-8 -*-
 from sympy import symbols, Poly, parse_expr
-import numpy as np
 from .internal import (
-        __make_partition__
-    ,   __permutations__
-    ,   __drop_trailing_zeros__
-    ,   __is_decreasing__
+        __permutations__
     ,   __msp_symbol__
     )
+from .partitions import Partition
 
 def monomial_symmetric_polynomial(n, kappa):
     """
@@ -31,20 +28,17 @@ def monomial_symmetric_polynomial(n, kappa):
     if not (isinstance(n, int) and n >= 1):
         raise ValueError("`n` must be a strictly positive integer.")
     variables = [symbols(f'x_{i}') for i in range(1, n+1)]
-    kappa_ = __make_partition__(kappa)
+    kappa_ = Partition(kappa)
     l = len(kappa_)
     if l > n:
         return Poly(0, *variables, domain='ZZ')
     if l == 0:
         return Poly(1, *variables, domain='ZZ')
-    mu = np.zeros(n, dtype=int)
-    mu[:l] = kappa_
+    mu = list(kappa_) + [0] * (n - l)
     perms_mu = __permutations__(mu)
-    x = [Poly(v, *variables, domain='ZZ') for v in variables]
-    terms = np.array([np.prod(np.array(
-        [x[i]**perm[i] for i in range(n)]    
-    )) for perm in perms_mu])
-    return np.sum(terms)
+    return Poly.from_dict(
+        {tuple(perm): 1 for perm in perms_mu}, *variables, domain='ZZ'
+    )
 
 def msp_combination(poly):
     """
@@ -67,9 +61,9 @@ def msp_combination(poly):
     out = {}
     d = poly.as_dict()
     for exponents in d.keys():
-        if __is_decreasing__(exponents):
-            kappa = __drop_trailing_zeros__(list(exponents))
-            out[tuple(kappa)] = d.get(exponents)
+        if all(p >= q for p, q in zip(exponents, exponents[1:])):
+            kappa = tuple(p for p in exponents if p > 0)
+            out[kappa] = d.get(exponents)
     return out
 
 def msp_combination_expr(poly):
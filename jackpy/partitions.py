@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from functools import cached_property
+from numbers import Integral
+import numpy as np
+
+
+# maximal number of partitions kept in the intern table
+__CACHE_SIZE__ = 4096
+
+
+class Partition(tuple):
+    """
+    Integer partition.
+
+    A `Partition` is a tuple of decreasing positive integers, and it prints
+    like the tuple of its parts. Trailing zeros are dropped. The most
+    recently used partitions are interned: creating a partition equal to one
+    of them returns the same object, whose conjugate, hook lengths and weight
+    are computed once and then cached. The intern table is bounded and can be
+    emptied with `clear_caches`.
+
+    Parameters
+    ----------
+    parts : iterable of integers
+        The parts of the integer partition, in decreasing order.
+
+    Examples
+    --------
+    >>> from jackpy.partitions import Partition
+    >>> lam = Partition([3, 1, 0])
+    >>> print(lam)
+    (3, 1)
+    >>> print(lam.conjugate)
+    (2, 1, 1)
+    >>> lam is Partition((3, 1))
+    True
+
+    """
+    __interned = OrderedDict()
+
+    def __new__(cls, parts=()):
+        key = tuple(parts)
+        # fast path only for canonical keys, so that the validation below
+        # never depends on what has been interned before
+        if all(type(i) is int for i in key) and (
+            len(key) == 0 or key[-1] != 0
+        ):
+            self = cls.__interned.get(key)
+            if self is not None:
+                cls.__interned.move_to_end(key)
+                return self
+        mu = list(key)
+        while len(mu) > 0 and mu[-1] == 0:
+            mu.pop()
+        if not all(isinstance(i, Integral) for i in mu):
+            raise ValueError("invalid integer partition.")
+        mu = [int(i) for i in mu]
+        if any(mu[i] < mu[i+1] for i in range(len(mu)-1)):
+            raise ValueError("invalid integer partition.")
+        if len(mu) > 0 and mu[-1] < 0:
+            raise ValueError("invalid integer partition.")
+        return cls._make(mu)
+
+    @classmethod
+    def _make(cls, parts):
+        # no validation: `parts` must be a list of decreasing positive ints
+        key = tuple(parts)
+        self = cls.__interned.get(key)
+        if self is None:
+            self = tuple.__new__(cls, key)
+            cls.__interned[key] = self
+            if len(cls.__interned) > __CACHE_SIZE__:
+                cls.__interned.popitem(last=False)
+        else:
+            cls.__interned.move_to_end(key)
+        return self
+
+    @classmethod
+    def _clear(cls):
+        cls.__interned.clear()
+
+    def __getnewargs__(self):
+        return (tuple(self),)
+
+    @cached_property
+    def weight(self):
+        """Sum of the parts."""
+        return sum(self)
+
+    @cached_property
+    def conjugate(self):
+        """Conjugate partition."""
+        if len(self) == 0:
+            return self
+        return Partition._make(
+            [sum(1 for p in self if p > j) for j in range(self[0])]
+        )
+
+    @cached_property
+    def arm_lengths(self):
+        """Arm lengths of the boxes, row by row (read-only array)."""
+        i = np.repeat(np.arange(len(self)), self)
+        j = self.__columns()
+        out = np.asarray(self, dtype=int)[i] - j - 1
+        out.flags.writeable = False
+        return out
+
+    @cached_property
+    def leg_lengths(self):
+        """Leg lengths of the boxes, row by row (read-only array)."""
+        i = np.repeat(np.arange(len(self)), self)
+        j = self.__columns()
+        out = np.asarray(self.conjugate, dtype=int)[j] - i - 1
+        out.flags.writeable = False
+        return out
+
+    @cached_property
+    def hook_lengths(self):
+        """Hook lengths of the boxes, row by row (read-only array)."""
+        out = self.arm_lengths + self.leg_lengths + 1
+        out.flags.writeable = False
+        return out
+
+    def __columns(self):
+        if len(self) == 0:
+            return np.asarray([], dtype=int)
+        return np.concatenate([np.arange(n) for n in self])
+
+    def contains(self, mu):
+        """Whether the Young diagram of `mu` is contained in this one."""
+        return len(mu) <= len(self) and all(
+            p <= q for p, q in zip(mu, self)
+        )
+
+    def dominates(self, mu):
+        """Whether this partition dominates `mu` (same weight required)."""
+        s = t = 0
+        for i in range(max(len(self), len(mu))):
+            s += self[i] if i < len(self) else 0
+            t += mu[i] if i < len(mu) else 0
+            if s < t:
+                return False
+        return s == t
+
+
+def partitions(k, max_length=None):
+    """
+    Integer partitions of a given weight.
+
+    Parameters
+    ----------
+    k : int
+        Nonnegative integer, the weight of the partitions.
+    max_length : int
+        If not `None`, only the partitions with at most `max_length` parts
+        are generated.
+
+    Returns
+    -------
+    generator
+        The integer partitions of `k`, as `Partition` objects, in reverse
+        lexicographic order, from `(k)` to `(1, ..., 1)`. This order is a
+        linear extension of the dominance order: a partition is generated
+        before all the partitions it dominates. The rank of a partition in
+        this sequence is given by `partition_rank`.
+
+    Examples
+    --------
+    >>> from jackpy.partitions import partitions
+    >>> print(list(partitions(4)))
+    [(4,), (3, 1), (2, 2), (2, 1, 1), (1, 1, 1, 1)]
+
+    """
+    if not (isinstance(k, Integral) and k >= 0):
+        raise ValueError("`k` must be a nonnegative integer.")
+    if max_length is None:
+        max_length = k
+    elif not (isinstance(max_length, Integral) and max_length >= 0):
+        raise ValueError("`max_length` must be a nonnegative integer.")
+    if k == 0:
+        yield Partition._make([])
+        return
+    if max_length < k:
+        yield from __bounded_partitions__(k, max_length)
+        return
+    # algorithm ZS1 of Zoghbi & Stojmenovic, ones kept implicit
+    a = [k] if k > 1 else []
+    ones = 1 if k == 1 else 0
+    while True:
+        yield Partition._make(a + [1] * ones)
+        if len(a) == 0:
+            return
+        r = a.pop() - 1
+        ones += 1
+        total = r + ones
+        ones = 0
+        if r == 1:
+            ones = total
+        else:
+            q, rem = divmod(total, r)
+            a.extend([r] * q)
+            if rem == 1:
+                ones = 1
+            elif rem > 1:
+                a.append(rem)
+
+
+def __bounded_partitions__(k, l):
+    # partitions of k > 0 with at most l parts, in reverse lexicographic
+    # order; only these partitions are visited
+    if l == 0:
+        return
+    a = [k]
+    while True:
+        yield Partition._make(a)
+        # decrease the rightmost part a[i] that can be decreased, i.e. such
+        # that the weight of a[i:] minus a[i] - 1 fits in l - i - 1 parts not
+        # greater than a[i] - 1, then refill greedily
+        tail = 0
+        i = len(a) - 1
+        while i >= 0:
+            tail += a[i]
+            p = a[i] - 1
+            if p >= 1 and tail - p <= p * (l - i - 1):
+                break
+            i -= 1
+        if i < 0:
+            return
+        rest = tail - p
+        del a[i:]
+        a.append(p)
+        q, rem = divmod(rest, p)
+        a.extend([p] * q)
+        if rem > 0:
+            a.append(rem)
+
+
+def sub_partitions(kappa):
+    """
+    Integer partitions contained in a given integer partition.
+
+    Parameters
+    ----------
+    kappa : list of integers
+        An integer partition given as a list of decreasing integers. Trailing
+        zeros are dropped.
+
+    Returns
+    -------
+    generator
+        The integer partitions `mu` such that `mu[i] <= kappa[i]` for all
+        `i`, including the empty partition and `kappa` itself, as `Partition`
+        objects in reverse lexicographic order.
+
+    Examples
+    --------
+    >>> from jackpy.partitions import sub_partitions
+    >>> print(list(sub_partitions([2, 1])))
+    [(2, 1), (2,), (1, 1), (1,), ()]
+
+    """
+    kappa = Partition(kappa)
+    l = len(kappa)
+    mu = []
+    def rec(i, bound):
+        if i == l or bound == 0:
+            yield Partition._make(mu)
+            return
+        for p in range(min(bound, kappa[i]), 0, -1):
+            mu.append(p)
+            yield from rec(i+1, p)
+            mu.pop()
+        yield Partition._make(mu)
+    yield from rec(0, kappa[0] if l > 0 else 0)
+
+
+# __counts__[k][m] is the number of integer partitions of k with parts at
+# most m, for 0 <= m <= k; the table is extended bottom-up as needed
+__counts__ = [[1]]
+
+
+def __count__(k, m):
+    # number of integer partitions of k with parts at most m
+    for j in range(len(__counts__), k+1):
+        row = [0] * (j+1)
+        for i in range(1, j+1):
+            row[i] = row[i-1] + __counts__[j-i][min(i, j-i)]
+        __counts__.append(row)
+    return __counts__[k][min(k, m)]
+
+
+def partition_rank(mu):
+    """
+    Rank of an integer partition among the partitions of its weight.
+
+    Parameters
+    ----------
+    mu : list of integers
+        An integer partition given as a list of decreasing integers. Trailing
+        zeros are dropped.
+
+    Returns
+    -------
+    int
+        The zero-based position of `mu` in the sequence generated by
+        `partitions(k)` where `k` is the weight of `mu`.
+
+    Examples
+    --------
+    >>> from jackpy.partitions import partition_rank
+    >>> partition_rank([2, 2])
+    2
+
+    """
+    mu = Partition(mu)
+    rank = 0
+    r = mu.weight
+    bound = r
+    for p in mu:
+        rank += __count__(r, min(bound, r)) - __count__(r, p)
+        r -= p
+        bound = p
+    return rank
+
+
+def clear_caches():
+    """
+    Clear the caches of this module.
+
+    Empties the table of interned partitions and the table of partition
+    counts used by `partition_rank`. Both are bounded or small, but this can
+    be useful to release memory after working with large partitions.
+
+    Returns
+    -------
+    None
+
+    """
+    Partition._clear()
+    del __counts__[1:]
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+from numbers import Integral, Number
+from sympy import Expr
+from .internal import (
+    __check_alpha__,
+    __check_n__,
+    __chop__,
+    __simplify__,
+    __Jack_b__,
+    __Jack_ratio__
+)
+from .littlewood_richardson import jack_product
+from .partitions import Partition
+
+
+def __inner_horizontal_strips__(kappa):
+    # partitions mu contained in kappa such that kappa/mu is a horizontal strip
+    k = list(kappa) + [0]
+    mu = []
+    def rec(i):
+        if i == len(kappa):
+            yield Partition._make([p for p in mu if p > 0])
+            return
+        for p in range(k[i], k[i+1]-1, -1):
+            mu.append(p)
+            yield from rec(i+1)
+            mu.pop()
+    yield from rec(0)
+
+
+def __branching_coefficient__(kappa, mu, alpha):
+    # P_kappa(x_1, ..., x_m) is the sum of the
+    # psi_{kappa/mu} x_m^{|kappa|-|mu|} P_mu(x_1, ..., x_{m-1}),
+    # Macdonald VI (7.9') and (6.24)
+    rows = [i for i in range(len(kappa)) if i >= len(mu) or mu[i] < kappa[i]]
+    columns = {
+        j for i in rows for j in range(mu[i] if i < len(mu) else 0, kappa[i])
+    }
+    out = 1
+    for i in rows:
+        for j in range(mu[i] if i < len(mu) else 0):
+            if j not in columns:
+                out = out * __Jack_b__(mu, i, j, alpha) \
+                    / __Jack_b__(kappa, i, j, alpha)
+    return out
+
+
+def __Jack_P_value__(kappa, x, alpha, memo):
+    # value of P_kappa at the first m = len(x) coordinates of x
+    m = len(x)
+    if len(kappa) > m:
+        return 0
+    if len(kappa) == 0:
+        return 1
+    if m == 1:
+        return x[0]**kappa[0]
+    key = (kappa, m)
+    value = memo.get(key)
+    if value is not None:
+        return value
+    value = 0
+    for mu in __inner_horizontal_strips__(kappa):
+        if len(mu) < m:
+            value = value + (
+                __branching_coefficient__(kappa, mu, alpha)
+                * x[m-1]**(kappa.weight - mu.weight)
+                * __Jack_P_value__(mu, x[:m-1], alpha, memo)
+            )
+    memo[key] = value
+    return value
+
+
+class JackSeries:
+    """
+    Truncated series of Jack polynomials.
+
+    A `JackSeries` represents a sum of terms `c_kappa * B_kappa(x)` where the
+    `B_kappa` are the Jack polynomials of a given kind and with a given Jack
+    parameter, and `kappa` runs over the integer partitions of weight at
+    most `K`. Terms of weight greater than `K` are never computed: the
+    product of two series is computed in the Jack basis, dropping the terms
+    above `K`. Series can be added, subtracted, multiplied together and by
+    scalars, raised to nonnegative integer powers, and evaluated.
+
+    Parameters
+    ----------
+    coefficients : dict
+        A dictionary whose keys are integer partitions and whose values are
+        the coefficients `c_kappa`. The partitions of weight greater than
+        `K` are dropped.
+    K : int
+        Nonnegative integer, the truncation degree.
+    alpha : number
+        A positive number or a symbol, the parameter of the Jack polynomials.
+    which: character
+        Which Jack polynomials, either `'J'`, `'C'`, `'P'` or `'Q'`. The
+        default `'C'` with `alpha = 2` gives a series of zonal polynomials.
+    n : int
+        If not `None`, the number of variables: the partitions with more than
+        `n` parts are dropped, since their Jack polynomial in `n` variables
+        is zero.
+
+    Examples
+    --------
+    >>> from gmpy2 import mpq
+    >>> from jackpy.series import JackSeries
+    >>> s = JackSeries({(): 1, (1,): 1}, 2, mpq(2))
+    >>> t = s * s
+    >>> print(t.coefficients)
+    {(): 1, (1,): mpq(2,1), (2,): mpq(1,1), (1, 1): mpq(1,1)}
+    >>> print(t.evaluate([mpq(1, 2), mpq(1, 3)]))
+    121/36
+
+    """
+    def __init__(self, coefficients, K, alpha, which = 'C', n=None):
+        if not (isinstance(K, Integral) and K >= 0):
+            raise ValueError("`K` must be a nonnegative integer.")
+        (alpha, _) = __check_alpha__(alpha)
+        if not which in ['J', 'C', 'P', 'Q']:
+            raise ValueError("`which` must be either 'J', 'C', 'P' or 'Q'.")
+        n = __check_n__(n)
+        self.__K = int(K)
+        self.__alpha = alpha
+        self.__which = which
+        self.__n = n
+        coeffs = {}
+        for kappa, c in coefficients.items():
+            kappa = Partition(kappa)
+            if kappa.weight > K or (n is not None and len(kappa) > n):
+                continue
+            coeffs[kappa] = coeffs.get(kappa, 0) + c
+        self.__coefficients = {
+            kappa: c for kappa, c in coeffs.items() if c != 0
+        }
+
+    @property
+    def K(self):
+        """Truncation degree."""
+        return self.__K
+
+    @property
+    def alpha(self):
+        """Jack parameter."""
+        return self.__alpha
+
+    @property
+    def which(self):
+        """Kind of the Jack polynomials, `'J'`, `'C'`, `'P'` or `'Q'`."""
+        return self.__which
+
+    @property
+    def n(self):
+        """Number of variables, or `None`."""
+        return self.__n
+
+    @property
+    def coefficients(self):
+        """Dictionary of the nonzero coefficients, keyed by partitions."""
+        return dict(self.__coefficients)
+
+    def __repr__(self):
+        return (
+            f"JackSeries({self.__coefficients!r}, K={self.__K}, alpha={self.__alpha!r}, "
+            f"which={self.__which!r}, n={self.__n!r})"
+        )
+
+    def __new_series(self, coefficients, K, n):
+        return JackSeries(coefficients, K, self.__alpha, self.__which, n)
+
+    def __combine(self, other):
+        if self.__alpha != other.alpha or self.__which != other.which:
+            raise ValueError(
+                "the two series must have the same `alpha` and `which`."
+            )
+        K = min(self.__K, other.K)
+        if self.__n is None:
+            n = other.n
+        elif other.n is None:
+            n = self.__n
+        else:
+            n = min(self.__n, other.n)
+        return (K, n)
+
+    def __add__(self, other):
+        if isinstance(other, JackSeries):
+            (K, n) = self.__combine(other)
+            out = self.coefficients
+            for kappa, c in other.coefficients.items():
+                out[kappa] = out.get(kappa, 0) + c
+            return self.__new_series(out, K, n)
+        if isinstance(other, (Number, Expr)):
+            out = self.coefficients
+            empty = Partition._make([])
+            out[empty] = out.get(empty, 0) + other
+            return self.__new_series(out, self.__K, self.__n)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return self * (-1)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, JackSeries):
+            (K, n) = self.__combine(other)
+            terms1 = sorted(
+                self.__coefficients.items(), key=lambda t: t[0].weight
+            )
+            terms2 = sorted(
+                other.coefficients.items(), key=lambda t: t[0].weight
+            )
+            out = {}
+            scales = {}
+            for lam, a in terms1:
+                for mu, b in terms2:
+                    if lam.weight + mu.weight > K:
+                        break
+                    product = jack_product(
+                        lam, mu, self.__alpha, self.__which, n
+                    )
+                    for nu, c in product.items():
+                        out[nu] = out.get(nu, 0) + a * b * c
+                        scales[nu] = scales.get(nu, 0) + abs(a * b * c)
+            out = {
+                nu: __simplify__(c, self.__alpha) for nu, c in out.items()
+            }
+            return self.__new_series(
+                __chop__(out, scales, self.__alpha), K, n
+            )
+        if isinstance(other, (Number, Expr)):
+            out = {
+                kappa: other * c for kappa, c in self.__coefficients.items()
+            }
+            return self.__new_series(out, self.__K, self.__n)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __pow__(self, k):
+        if not (isinstance(k, Integral) and k >= 0):
+            return NotImplemented
+        out = self.__new_series({(): 1}, self.__K, self.__n)
+        square = self
+        while k > 0:
+            if k % 2 == 1:
+                out = out * square
+            k //= 2
+            if k > 0:
+                square = square * square
+        return out
+
+    def evaluate(self, x):
+        """
+        Numeric evaluation of the series.
+
+        Parameters
+        ----------
+        x : list of numbers
+            The values of the variables `x_1`, ..., `x_m`. If the series has
+            a number of variables `n`, then `m` must not exceed `n`.
+
+        Returns
+        -------
+        number
+            The value of the truncated series at `x`. The Jack polynomials
+            are evaluated with the branching rule, without being expanded.
+
+        """
+        x = list(x)
+        if self.__n is not None and len(x) > self.__n:
+            raise ValueError("`x` must have at most `n` elements.")
+        alpha = self.__alpha
+        memo = {}
+        out = 0
+        for kappa, c in self.__coefficients.items():
+            value = __Jack_P_value__(kappa, x, alpha, memo)
+            if value == 0:
+                continue
+            out = out + (
+                c * __Jack_ratio__(kappa, alpha, self.__which, 'P') * value
+            )
+        return out
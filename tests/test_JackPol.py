@@ -23,6 +23,11 @@ def test_msp_combination():
     dic = check_mscombo(jp)
     assert dic == jp.as_dict()
 
+def test_msp_combination_keys_are_tuples():
+    combo = msp_combination(SchurPol(3, [2, 1]))
+    assert all(type(kappa) is tuple for kappa in combo)
+    assert combo == {(2, 1): 1, (1, 1, 1): 2}
+
 def test_msp_combination_expr():
     mu = [3, 1]
     alpha = mpq(5, 2)
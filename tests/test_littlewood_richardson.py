@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+from gmpy2 import mpq
+from sympy import symbols, Poly
+from jackpy.jack import JackPol, SchurPol
+from jackpy.partitions import partitions
+import jackpy.littlewood_richardson as lr
+from jackpy.littlewood_richardson import (
+        lr_coefficient
+    ,   schur_product
+    ,   schur_combination_product
+    ,   jack_pieri
+    ,   clear_caches
+    ,   jack_product
+    )
+
+def combination_to_poly(n, combo, f):
+    variables = [symbols(f'x_{i}') for i in range(1, n+1)]
+    q = Poly(0, *variables)
+    for nu, c in combo.items():
+        q = q + c * f(n, list(nu))
+    return q
+
+def test_schur_product():
+    combo = schur_product([2, 1], [2, 1])
+    expected = {
+        (4, 2): 1, (4, 1, 1): 1, (3, 3): 1, (3, 2, 1): 2, (3, 1, 1, 1): 1,
+        (2, 2, 2): 1, (2, 2, 1, 1): 1
+    }
+    assert combo == expected
+    assert lr_coefficient([2, 1], [2, 1], [3, 2, 1]) == 2
+    assert lr_coefficient([2, 1], [2, 1], [5, 1]) == 0
+
+def test_lr_coefficient_matches_schur_product():
+    lam = [3, 2, 1]
+    mu = [2, 2]
+    combo = schur_product(lam, mu)
+    for nu in partitions(10):
+        assert lr_coefficient(lam, mu, nu) == combo.get(nu, 0)
+
+def test_schur_product_truncated():
+    n = 3
+    lam = [3, 1]
+    mu = [2, 2, 1]
+    combo = schur_product(lam, mu, n)
+    assert all(len(nu) <= n for nu in combo)
+    expected = SchurPol(n, lam) * SchurPol(n, mu)
+    assert combination_to_poly(n, combo, SchurPol) == expected
+
+def test_schur_combination_product():
+    f = {(1,): 1}
+    g = {(1,): 1, (2,): -1}
+    assert schur_combination_product(f, g) == {
+        (2,): 1, (1, 1): 1, (3,): -1, (2, 1): -1
+    }
+
+def test_jack_pieri():
+    n = 4
+    alpha = mpq(3, 2)
+    lam = [2, 1]
+    for which in ['J', 'C', 'P', 'Q']:
+        for vertical in [False, True]:
+            rho = [1, 1] if vertical else [2]
+            combo = jack_pieri(lam, 2, alpha, which, n, vertical)
+            expected = (
+                JackPol(n, lam, alpha, which) * JackPol(n, rho, alpha, which)
+            )
+            obtained = combination_to_poly(
+                n, combo, lambda m, kappa: JackPol(m, kappa, alpha, which)
+            )
+            assert obtained == expected
+
+def test_jack_pieri_alpha_one_is_schur():
+    combo = jack_pieri([2, 1], 2, mpq(1), which = 'P')
+    assert combo == schur_product([2, 1], [2])
+
+def test_jack_product():
+    n = 3
+    alpha = mpq(3, 2)
+    lam = [2, 1]
+    mu = [2, 1]
+    for which in ['J', 'C', 'P', 'Q']:
+        combo = jack_product(lam, mu, alpha, which, n)
+        assert all(len(nu) <= n for nu in combo)
+        expected = JackPol(n, lam, alpha, which) * JackPol(n, mu, alpha, which)
+        obtained = combination_to_poly(
+            n, combo, lambda m, kappa: JackPol(m, kappa, alpha, which)
+        )
+        assert obtained == expected
+
+def test_jack_product_alpha_one_is_schur():
+    combo = jack_product([3, 1], [2, 1], mpq(1), which = 'P')
+    assert combo == schur_product([3, 1], [2, 1])
+
+def test_clear_caches():
+    expected = schur_product([3, 2, 1], [2, 2])
+    combo = jack_pieri([2, 1], 2, 0.5)
+    product = jack_product([2, 1], [2, 1], 0.5)
+    caches = [
+        lr.__lr_expansion__, lr.__jack_pieri_P__,
+        lr.__e_expansion_P__, lr.__jack_product_P__
+    ]
+    assert all(cache.cache_info().currsize > 0 for cache in caches)
+    clear_caches()
+    assert all(cache.cache_info().currsize == 0 for cache in caches)
+    assert schur_product([3, 2, 1], [2, 2]) == expected
+    assert jack_pieri([2, 1], 2, 0.5) == combo
+    assert jack_product([2, 1], [2, 1], 0.5) == product
+
+def test_jack_product_float_alpha():
+    exact = jack_product([3, 2, 1], [2, 2, 1], mpq(7, 10), which = 'C')
+    inexact = jack_product([3, 2, 1], [2, 2, 1], 0.7, which = 'C')
+    assert set(inexact) == set(exact)
+    for nu, c in exact.items():
+        assert abs(inexact[nu] - c) < 1e-12
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from sympy.combinatorics.partitions import IntegerPartition
+from jackpy.jack import SchurPol
+from jackpy.partitions import (
+        Partition
+    ,   partitions
+    ,   sub_partitions
+    ,   partition_rank
+    ,   clear_caches
+    ,   __CACHE_SIZE__
+    )
+
+
+def test_partition_interning():
+    lam = Partition([3, 1, 0, 0])
+    assert lam == (3, 1)
+    assert lam is Partition((3, 1))
+    assert lam.weight == 4
+    assert repr(lam) == "(3, 1)" and str(Partition([])) == "()"
+    with pytest.raises(ValueError):
+        Partition([1, 2])
+    with pytest.raises(ValueError):
+        Partition([2, 1.5])
+
+def test_partition_validation_does_not_depend_on_interning():
+    Partition((2, 1))
+    with pytest.raises(ValueError):
+        Partition([2.0, 1])
+    with pytest.raises(ValueError):
+        SchurPol(2, [2.0, 1])
+    lam = Partition(np.array([2, 1, 0]))
+    assert lam is Partition((2, 1))
+    assert all(type(p) is int for p in lam)
+
+def test_conjugate_and_hooks():
+    lam = Partition([4, 2, 2, 1])
+    assert list(lam.conjugate) == IntegerPartition([4, 2, 2, 1]).conjugate
+    assert list(lam.hook_lengths) == [7, 5, 2, 1, 4, 2, 3, 1, 1]
+
+def test_partitions():
+    k = 8
+    parts = list(partitions(k))
+    assert len(parts) == 22
+    assert parts == sorted(parts, reverse=True)
+    for i, lam in enumerate(parts):
+        assert lam.weight == k
+        assert partition_rank(lam) == i
+        for mu in parts[:i]:
+            assert not lam.dominates(mu) or lam == mu
+    assert list(partitions(k, max_length=2)) == [
+        lam for lam in parts if len(lam) <= 2
+    ]
+
+def test_partitions_max_length():
+    for k in range(12):
+        parts = list(partitions(k))
+        for l in range(k+2):
+            assert list(partitions(k, max_length=l)) == [
+                lam for lam in parts if len(lam) <= l
+            ]
+    assert sum(1 for _ in partitions(200, max_length=2)) == 101
+    with pytest.raises(ValueError):
+        list(partitions(5, max_length=-1))
+    with pytest.raises(ValueError):
+        list(partitions(5, max_length=1.5))
+
+def test_sub_partitions():
+    kappa = Partition([3, 2, 2])
+    subs = list(sub_partitions(kappa))
+    assert len(subs) == 16
+    assert len(set(subs)) == 16
+    assert all(kappa.contains(mu) for mu in subs)
+    assert subs[0] == kappa and subs[-1] == ()
+
+def test_partition_rank_large_part():
+    assert partition_rank([1000]) == 0
+    assert partition_rank([999, 1]) == 1
+    assert partition_rank([1] * 30) == sum(1 for _ in partitions(30)) - 1
+
+def test_intern_table_is_bounded():
+    interned = Partition._Partition__interned
+    lam = Partition([3, 1])
+    assert sum(1 for _ in partitions(30)) > __CACHE_SIZE__
+    assert len(interned) == __CACHE_SIZE__
+    assert Partition([3, 1]) == lam
+    clear_caches()
+    assert len(interned) == 0
+    assert partition_rank([2, 2]) == 2
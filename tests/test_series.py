@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from gmpy2 import mpq
+from sympy import symbols
+from jackpy.jack import JackPol, ZonalPol
+from jackpy.series import JackSeries
+
+def test_series_truncated_product():
+    alpha = mpq(2)
+    f = JackSeries({(): 1, (1,): 2, (2,): mpq(1, 3), (1, 1): -1}, 3, alpha)
+    g = JackSeries({(): mpq(1, 2), (1,): -1, (2, 1): 4}, 3, alpha)
+    h = f * g
+    assert h.K == 3
+    assert all(kappa.weight <= 3 for kappa in h.coefficients)
+    f_full = JackSeries(f.coefficients, 6, alpha)
+    g_full = JackSeries(g.coefficients, 6, alpha)
+    h_full = f_full * g_full
+    assert h.coefficients == {
+        kappa: c for kappa, c in h_full.coefficients.items()
+        if kappa.weight <= 3
+    }
+    x = [mpq(1, 2), mpq(-1, 3), mpq(2, 5)]
+    assert h_full.evaluate(x) == f.evaluate(x) * g.evaluate(x)
+
+def test_series_evaluate():
+    n = 3
+    alpha = mpq(3, 2)
+    x = [mpq(1, 2), mpq(-1, 3), mpq(2, 5)]
+    values = dict(zip(symbols(f'x_1:{n+1}'), x))
+    coefficients = {(2, 1): 3, (3,): mpq(1, 7), (1, 1, 1): -2}
+    for which in ['J', 'C', 'P', 'Q']:
+        s = JackSeries(coefficients, 3, alpha, which, n)
+        expected = sum(
+            c * JackPol(n, list(kappa), alpha, which).eval(values)
+            for kappa, c in coefficients.items()
+        )
+        assert s.evaluate(x) == expected
+
+def test_zonal_series_arithmetic():
+    s = JackSeries({(1,): 1}, 2, mpq(2), n = 2)
+    t = (1 + s)**2
+    assert t.coefficients == {(): 1, (1,): 2, (2,): 1, (1, 1): 1}
+    assert (t - t).coefficients == {}
+    assert (2 * t - t).coefficients == t.coefficients
+    x = [mpq(1, 2), mpq(1, 3)]
+    values = dict(zip(symbols('x_1:3'), x))
+    assert t.evaluate(x) == (
+        1 + 2 * ZonalPol(2, [1]).eval(values) + ZonalPol(2, [2]).eval(values)
+        + ZonalPol(2, [1, 1]).eval(values)
+    )
+
+def test_series_float_alpha():
+    s = JackSeries({(2, 1): 1}, 6, 0.7)**2
+    t = JackSeries({(2, 1): 1}, 6, mpq(7, 10))**2
+    assert set(s.coefficients) == set(t.coefficients)
+    for kappa, c in t.coefficients.items():
+        assert abs(s.coefficients[kappa] - c) < 1e-12 * abs(c)